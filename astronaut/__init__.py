@@ -1,3 +1,19 @@
-from .astronaut import Astronaut
+from .astronaut import (
+    MODE_COGNITIVE,
+    MODE_HARD,
+    MODE_LOW,
+    MODE_NORMAL,
+    MODE_REST,
+    Astronaut,
+)
+from .ensemble import AstronautEnsemble
 
-__all__ = ["Astronaut"]
\ No newline at end of file
+__all__ = [
+    "Astronaut",
+    "AstronautEnsemble",
+    "MODE_REST",
+    "MODE_LOW",
+    "MODE_NORMAL",
+    "MODE_HARD",
+    "MODE_COGNITIVE",
+]
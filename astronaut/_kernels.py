@@ -0,0 +1,177 @@
+"""
+Per-minute update kernels shared by Astronaut and AstronautEnsemble.
+
+With Numba installed the kernels are JIT-compiled (cached on disk) into one
+fused loop over the state; without it they fall back to the equivalent
+vectorized NumPy calls. The `xp_*` versions take the array module as their
+first argument, so the same code also drives CuPy device arrays.
+
+The compiled kernels index the (modes, fields) tables without bounds
+checks, so callers (Astronaut.eva_step/advance, AstronautEnsemble.eva_step)
+must validate modes before calling them.
+
+A step of `minutes` minutes is exact, not an approximation: each value moves
+toward its target by at most delta per minute, never past it, then is
+clipped to [low, high]. The first minute is taken as a plain one-minute
+move, which brings a state set outside the limits back inside. From there a
+saturating move toward a fixed target is monotone and can only stop at the
+target or at a limit, so the remaining minutes collapse into one move of up
+to delta * (minutes - 1). `_advance` (compiled) and `xp_tick` (array module)
+are the two implementations of this rule.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is an optional speed-up
+    njit = None
+
+
+# =============================================================
+# Array-module kernels (NumPy fallback, CuPy backend)
+# =============================================================
+def xp_make_scratch(xp, state):
+    # Two state-shaped buffers for the lower/upper reach of a step
+    return xp.empty((2,) + state.shape, dtype=state.dtype)
+
+
+def xp_move(xp, state, target, delta, low, high, scratch):
+    # One move toward target by at most delta, then limits; every ufunc
+    # writes into `scratch`/`state`, so there are no per-call allocations.
+    # `delta` may alias reach_hi: it is read before reach_hi is written.
+    reach_lo, reach_hi = scratch
+    xp.subtract(state, delta, out=reach_lo)
+    xp.add(state, delta, out=reach_hi)
+    xp.clip(target, reach_lo, reach_hi, out=state)
+    xp.clip(state, low, high, out=state)
+
+
+def xp_tick(xp, state, target, delta, low, high, minutes, scratch):
+    # First minute, then the rest in closed form (see module docstring)
+    xp_move(xp, state, target, delta, low, high, scratch)
+    if minutes > 1:
+        delta = xp.multiply(delta, minutes - 1, out=scratch[1])
+        xp_move(xp, state, target, delta, low, high, scratch)
+
+
+def xp_tick_gather(xp, state, targets, deltas, modes, low, high, minutes, scratch):
+    # Gather each row's targets/deltas, then one broadcast step
+    xp_tick(xp, state, targets[modes], deltas[modes], low, high, minutes, scratch)
+
+
+def xp_run_schedule(xp, state, targets, deltas, low, high, modes, minutes, scratch):
+    # One step per (mode, minutes) segment of a mission timeline
+    for mode, segment in zip(modes.tolist(), minutes.tolist()):
+        xp_tick(xp, state, targets[mode], deltas[mode], low, high, segment, scratch)
+
+
+def xp_record_schedule(xp, state, targets, deltas, low, high, modes, minutes, scratch, out):
+    # As xp_run_schedule, also copying the state after segment k into out[k]
+    for k, (mode, segment) in enumerate(zip(modes.tolist(), minutes.tolist())):
+        xp_tick(xp, state, targets[mode], deltas[mode], low, high, segment, scratch)
+        out[k] = state
+
+
+if njit is not None:
+
+    def make_scratch(state):
+        # The compiled loops keep everything in registers
+        return None
+
+    def warm_up(targets, deltas, low, high):
+        """
+        Compile the single-astronaut kernels now (or load them from the
+        on-disk cache) so the first simulated minute pays no JIT cost.
+        """
+        state = low.copy()
+        tick(state, targets[0], deltas[0], low, high, 1, None)
+        steps = np.ones(1, dtype=np.int64)
+        run_schedule(state, targets, deltas, low, high, steps - 1, steps, None)
+        out = np.empty((1, state.shape[0]))
+        record_schedule(state, targets, deltas, low, high, steps - 1, steps, None, out)
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _move(s, target, d, low, high):
+        # Move s toward target by at most d, then apply limits
+        v = target
+        if v < s - d:
+            v = s - d
+        elif v > s + d:
+            v = s + d
+        if v < low:
+            v = low
+        elif v > high:
+            v = high
+        return v
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _advance(s, target, d, low, high, minutes):
+        # First minute, then the rest in closed form (see module docstring)
+        v = _move(s, target, d, low, high)
+        if minutes > 1:
+            v = _move(v, target, d * (minutes - 1), low, high)
+        return v
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def tick(state, target, delta, low, high, minutes, scratch):
+        for i in range(state.shape[0]):
+            state[i] = _advance(state[i], target[i], delta[i], low[i], high[i], minutes)
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def run_schedule(state, targets, deltas, low, high, modes, minutes, scratch):
+        # Whole mission timeline in one compiled call
+        for k in range(modes.shape[0]):
+            tick(state, targets[modes[k]], deltas[modes[k]], low, high, minutes[k], scratch)
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def record_schedule(state, targets, deltas, low, high, modes, minutes, scratch, out):
+        # Whole timeline in one call, keeping the state after each segment
+        for k in range(modes.shape[0]):
+            tick(state, targets[modes[k]], deltas[modes[k]], low, high, minutes[k], scratch)
+            for i in range(state.shape[0]):
+                out[k, i] = state[i]
+
+    @njit(cache=True, fastmath=True, boundscheck=False, parallel=True)
+    def tick_batch(state, target, delta, low, high, minutes, scratch):
+        # Same as `tick`, one row per astronaut, rows spread over threads
+        for n in prange(state.shape[0]):
+            row = state[n]
+            for i in range(row.shape[0]):
+                row[i] = _advance(row[i], target[i], delta[i], low[i], high[i], minutes)
+
+    @njit(cache=True, fastmath=True, boundscheck=False, parallel=True)
+    def tick_gather(state, targets, deltas, modes, low, high, minutes, scratch):
+        # Per-row activity: row n uses targets/deltas row modes[n]
+        for n in prange(state.shape[0]):
+            row = state[n]
+            target = targets[modes[n]]
+            delta = deltas[modes[n]]
+            for i in range(row.shape[0]):
+                row[i] = _advance(row[i], target[i], delta[i], low[i], high[i], minutes)
+
+else:
+
+    def make_scratch(state):
+        return xp_make_scratch(np, state)
+
+    def tick(state, target, delta, low, high, minutes, scratch):
+        xp_tick(np, state, target, delta, low, high, minutes, scratch)
+
+    def warm_up(targets, deltas, low, high):
+        # Nothing to compile
+        pass
+
+    def run_schedule(state, targets, deltas, low, high, modes, minutes, scratch):
+        xp_run_schedule(np, state, targets, deltas, low, high, modes, minutes, scratch)
+
+    def record_schedule(state, targets, deltas, low, high, modes, minutes, scratch, out):
+        xp_record_schedule(
+            np, state, targets, deltas, low, high, modes, minutes, scratch, out
+        )
+
+    # Broadcasting makes the NumPy version work for (n, fields) as well
+    tick_batch = tick
+
+    def tick_gather(state, targets, deltas, modes, low, high, minutes, scratch):
+        xp_tick_gather(np, state, targets, deltas, modes, low, high, minutes, scratch)
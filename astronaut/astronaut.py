@@ -1,92 +1,289 @@
-import pandas as pd
-from dataclasses import dataclass, field
-from typing import ClassVar, Dict, Tuple
+import operator
+import os
+import zipfile
+
+import numpy as np
+from typing import ClassVar, Dict, Optional, Tuple
+
+from ._kernels import make_scratch, record_schedule, run_schedule, tick, warm_up
 
 """
 Physiological model of an astronaut for EVA simulation.
 """
-@dataclass
+
+# Canonical order of the dynamic state vector
+_FIELDS = (
+    "heart_rate",
+    "blood_pressure_sys",
+    "blood_pressure_dia",
+    "respiration_rate",
+    "oxygen_saturation",
+    "blood_o2_pa",
+    "blood_co2_pa",
+    "metabolic_rate",
+    "skin_temp",
+    "sweat_rate",
+    "n2_saturation",
+    "core_temp",
+    "glucose_level",
+    "muscle_fatigue",
+    "cognitive_load",
+    "stress_index",
+)
+
+# Integer indices into Astronaut.state, used instead of attribute names
+(
+    HEART_RATE,
+    BLOOD_PRESSURE_SYS,
+    BLOOD_PRESSURE_DIA,
+    RESPIRATION_RATE,
+    OXYGEN_SATURATION,
+    BLOOD_O2_PA,
+    BLOOD_CO2_PA,
+    METABOLIC_RATE,
+    SKIN_TEMP,
+    SWEAT_RATE,
+    N2_SATURATION,
+    CORE_TEMP,
+    GLUCOSE_LEVEL,
+    MUSCLE_FATIGUE,
+    COGNITIVE_LOAD,
+    STRESS_INDEX,
+) = range(len(_FIELDS))
+
+# Activity modes: row indices into Astronaut._TARGETS / Astronaut._DELTAS
+MODE_REST, MODE_LOW, MODE_NORMAL, MODE_HARD, MODE_COGNITIVE = range(5)
+
+
+def _clamp(value: float, low: float, high: float) -> float:
+    # Scalar counterpart of np.clip: plain comparisons, no builtin calls
+    return low if value < low else high if value > high else value
+
+
 class Astronaut:
+    # Per-instance storage is just the state vector and the mission clock;
+    # physiological names are properties over `state` (see bottom of file)
+    __slots__ = ("state", "mission_elapsed_time", "_scratch")
+
     # === Mission specific ========================================
-    mission_elapsed_time: float
-    _ATTR_DF: ClassVar[pd.DataFrame] = None
+    # Absolute path of the attributes.csv the tables below were built from
+    # (None before init())
+    _CSV_PATH: ClassVar[Optional[str]] = None
 
     _BASELINE: ClassVar[Dict[str, str]] = {}
     _LIMITS: ClassVar[Dict[str, Tuple[float, float]]] = {}
 
+    # === SoA layout ==============================================
+    # Dynamic state lives in one float64 vector; every table below is
+    # aligned to _FIELDS (same order as attributes.csv).
+    _FIELDS: ClassVar[Tuple[str, ...]] = _FIELDS
+    _IDX: ClassVar[Dict[str, int]] = {name: i for i, name in enumerate(_FIELDS)}
+
+    # Task column prefixes in attributes.csv (<KEY>_BASE / <KEY>_RATE),
+    # listed in MODE_* order
+    _TASK_KEYS: ClassVar[Tuple[str, ...]] = ("R", "L", "N", "H", "C")
+
+    _BASELINE_ARR: ClassVar[np.ndarray] = None
+    _LOW_ARR: ClassVar[np.ndarray] = None
+    _HIGH_ARR: ClassVar[np.ndarray] = None
+    _LOW_TBL: ClassVar[Tuple[float, ...]] = ()
+    _HIGH_TBL: ClassVar[Tuple[float, ...]] = ()
+    # (modes, fields) tables: row MODE_* holds that activity's targets/deltas
+    _TARGETS: ClassVar[np.ndarray] = None
+    _DELTAS: ClassVar[np.ndarray] = None
+
     @classmethod
-    def init(cls, csv_path: str = "attributes.csv"):
+    def _load_tables(
+        cls, csv_path: str, use_cache: bool = True
+    ) -> Dict[str, np.ndarray]:
+        """
+        Columns of attributes.csv as plain arrays, keyed by column name
+        ("index" holds the attribute names). The parsed table is cached
+        next to the CSV as .npz together with the CSV's size and mtime, and
+        reused only while both match exactly, so pandas is only imported
+        when the cache has to be rebuilt. `use_cache=False` always re-parses.
+        """
+        columns = ["BASELINE_0", "MIN", "MAX"]
+        for key in cls._TASK_KEYS:
+            columns += [f"{key}_BASE", f"{key}_RATE"]
+
+        cache_path = os.path.splitext(csv_path)[0] + ".npz"
+        csv_stat = os.stat(csv_path)
+        stamp = np.array([csv_stat.st_size, csv_stat.st_mtime_ns], dtype=np.int64)
+        if use_cache:
+            try:
+                with np.load(cache_path, allow_pickle=False) as npz:
+                    # Same CSV and every column init() needs, else rebuild
+                    if np.array_equal(npz["_csv_stamp"], stamp) and set(
+                        ["index", *columns]
+                    ).issubset(npz.files):
+                        return {key: npz[key] for key in ["index", *columns]}
+            except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+                # Missing, corrupt or old-format cache: rebuild it
+                pass
+
+        import pandas as pd
+
         df = pd.read_csv(csv_path, index_col=0)
-        cls._ATTR_DF = df
+        tables = {"index": df.index.to_numpy(dtype=str)}
+        for col in columns:
+            tables[col] = df[col].to_numpy(dtype=np.float64)
+
+        # Write to a temp file first so a concurrent run never sees half a cache
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp.npz"
+        try:
+            np.savez(tmp_path, _csv_stamp=stamp, **tables)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Cache is optional: drop the partial file and carry on
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        return tables
+
+    @classmethod
+    def init(cls, csv_path: str = "attributes.csv", force: bool = False):
+        # Tables are class-wide: loading the same file twice is a no-op
+        # unless `force` asks for a rebuild
+        source = os.path.abspath(csv_path)
+        if cls._CSV_PATH == source and not force:
+            return
+        tables = cls._load_tables(csv_path, use_cache=not force)
+        names = tables["index"].tolist()
+
+        # Build SoA tables in _FIELDS order
+        row = {name: i for i, name in enumerate(names)}
+        order = np.array([row[name] for name in cls._FIELDS])
+        baseline_arr = tables["BASELINE_0"][order]
+        low_arr = tables["MIN"][order]
+        high_arr = tables["MAX"][order]
+
+        # Attributes without a target/rate for a task get delta = 0 (no-op)
+        targets = np.stack([tables[f"{key}_BASE"] for key in cls._TASK_KEYS])[:, order]
+        rates = np.abs(np.stack([tables[f"{key}_RATE"] for key in cls._TASK_KEYS]))[:, order]
+        active = ~(np.isnan(targets) | np.isnan(rates))
+        targets = np.ascontiguousarray(np.where(active, targets, 0.0))
+        deltas = np.ascontiguousarray(np.where(active, rates, 0.0))
+
+        # Validate and compile before touching the class: a failed init()
+        # leaves the previously loaded tables in place
+        cls._check_tables(low_arr, high_arr, deltas)
+        warm_up(targets, deltas, low_arr, high_arr)
 
         # Convert all baseline values to float explicitly
-        cls._BASELINE = df["BASELINE_0"].astype(float).to_dict()
+        cls._BASELINE = dict(zip(names, tables["BASELINE_0"].tolist()))
 
         # Read min/max limits
         cls._LIMITS = {
-            attr: (float(row["MIN"]), float(row["MAX"])) for attr, row in df.iterrows()
+            attr: (low, high)
+            for attr, low, high in zip(
+                names, tables["MIN"].tolist(), tables["MAX"].tolist()
+            )
         }
 
+        cls._BASELINE_ARR = baseline_arr
+        cls._LOW_ARR = low_arr
+        cls._HIGH_ARR = high_arr
+        # Plain-float copies for the scalar helpers (no NumPy scalar boxing)
+        cls._LOW_TBL = tuple(low_arr.tolist())
+        cls._HIGH_TBL = tuple(high_arr.tolist())
+        cls._TARGETS = targets
+        cls._DELTAS = deltas
+        cls._CSV_PATH = source
+
+    @classmethod
+    def validate_deltas(cls) -> None:
+        """
+        One-off sanity check of the tables built by `init()`, so the
+        per-minute helpers can run without assertions. Raises ValueError
+        naming the offending attribute.
+        """
+        cls._check_tables(cls._LOW_ARR, cls._HIGH_ARR, cls._DELTAS)
+
+    @classmethod
+    def _check_tables(
+        cls, low: np.ndarray, high: np.ndarray, deltas: np.ndarray
+    ) -> None:
+        for name, lo, hi in zip(cls._FIELDS, low.tolist(), high.tolist()):
+            if not lo <= hi:
+                raise ValueError(f"MIN > MAX for {name!r}")
+
+        for key, delta in zip(cls._TASK_KEYS, deltas):
+            bad = ~(np.isfinite(delta) & (delta >= 0))
+            if bad.any():
+                name = cls._FIELDS[int(np.argmax(bad))]
+                raise ValueError(f"Invalid {key}_RATE for {name!r}: must be finite")
+
     def __init__(self):
-        base = self.__class__._BASELINE
-
-        # Initialize dynamic fields from baseline
-        self.mission_elapsed_time = 0.0
-
-        self.heart_rate         = base["heart_rate"]
-        self.blood_pressure_sys = base["blood_pressure_sys"]
-        self.blood_pressure_dia = base["blood_pressure_dia"]
-        self.respiration_rate   = base["respiration_rate"]
-        self.oxygen_saturation  = base["oxygen_saturation"]
-        self.blood_o2_pa        = base["blood_o2_pa"]
-        self.blood_co2_pa       = base["blood_co2_pa"]
-        self.n2_saturation      = base["n2_saturation"]
-        self.metabolic_rate     = base["metabolic_rate"]
-        self.core_temp          = base["core_temp"]
-        self.skin_temp          = base["skin_temp"]
-        self.sweat_rate         = base["sweat_rate"]
-        self.glucose_level      = base["glucose_level"]
-        self.muscle_fatigue     = base["muscle_fatigue"]
-        self.cognitive_load     = base["cognitive_load"]
-        self.stress_index       = base["stress_index"]
+        # Initialize dynamic fields from baseline; the mission clock counts
+        # whole minutes as an int so it never accumulates rounding error
+        self.mission_elapsed_time = 0
+        self.state = self.__class__._BASELINE_ARR.copy()
+        # Reused by the NumPy kernel for every step (None under Numba)
+        self._scratch = make_scratch(self.state)
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={value:.4g}" for name, value in zip(self._FIELDS, self.state.tolist())
+        )
+        return (
+            f"{type(self).__name__}("
+            f"mission_elapsed_time={self.mission_elapsed_time}, {values})"
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Astronaut):
+            return NotImplemented
+        return (
+            self.mission_elapsed_time == other.mission_elapsed_time
+            and np.array_equal(self.state, other.state)
+        )
+
+    # Mutable state: not hashable
+    __hash__ = None
 
     # =============================================================
     # Utility: update value considering limits
     # =========================================================================
-    def _update(self, name: str, delta: float) -> None:
-        value = getattr(self, name) + delta
-        low, high = self._LIMITS.get(name, (-float("inf"), float("inf")))
-        setattr(self, name, max(low, min(high, value)))
+    def _update(self, idx: int, delta: float) -> None:
+        value = self.state[idx] + delta
+        self.state[idx] = _clamp(value, self._LOW_TBL[idx], self._HIGH_TBL[idx])
 
     # -----------------------------------------------------------------
     # Helper: nudge value toward a given baseline (up or down)
     # -----------------------------------------------------------------
-    def _toward_target(self, name: str, target_baseline: float, delta: float) -> None:
+    def _toward_target(self, idx: int, target_baseline: float, delta: float) -> None:
         """
-        Move attribute `name` toward `target_baseline` by up to `delta` (always positive).
+        Move state entry `idx` (e.g. HEART_RATE) toward `target_baseline` by up to `delta` (always positive).
         The value will:
         • move in the correct direction (up/down),
         • stop at the baseline (no overshoot),
         • stay within the global _LIMITS.
         """
-        assert delta >= 0, "Delta must be non-negative"
-
-        current = getattr(self, name)
-        direction = 1 if target_baseline > current else -1
-        raw_step = direction * delta
-        proposed = current + raw_step
-
-        # Clamp to baseline if we're going to overshoot
-        if direction > 0 and proposed > target_baseline:
-            proposed = target_baseline
-        elif direction < 0 and proposed < target_baseline:
-            proposed = target_baseline
+        current = self.state[idx]
+        # Clamping the target into reach moves by at most `delta` in the
+        # right direction and stops exactly at the baseline (no overshoot)
+        proposed = _clamp(target_baseline, current - delta, current + delta)
 
         # Respect global limits
-        low, high = self._LIMITS.get(name, (-float("inf"), float("inf")))
-        proposed = max(low, min(high, proposed))
+        self.state[idx] = _clamp(proposed, self._LOW_TBL[idx], self._HIGH_TBL[idx])
 
-        setattr(self, name, proposed)
+    # -----------------------------------------------------------------
+    # Helper: nudge the whole state vector toward per-task targets
+    # -----------------------------------------------------------------
+    def _toward_target_vec(
+        self, target: np.ndarray, delta: np.ndarray, minutes: int = 1
+    ) -> None:
+        """
+        Vectorized `_toward_target` over every attribute at once, for
+        `minutes` consecutive minutes in a single kernel call. The result
+        equals `minutes` one-minute steps (see astronaut/_kernels.py).
+        """
+        tick(
+            self.state, target, delta, self._LOW_ARR, self._HIGH_ARR, minutes,
+            self._scratch,
+        )
 
     # =============================================================
     # Public methods
@@ -98,8 +295,63 @@ class Astronaut:
         resting values. Anthropometric data (mass, volume, age) are
         unchanged.
         """
-        for key, value in self._BASELINE.items():
-            setattr(self, key, value)
+        np.copyto(self.state, self._BASELINE_ARR)
+
+    # -----------------------------------------------------------------
+    # Generic activity step; the eva_* methods below are named shortcuts
+    # -----------------------------------------------------------------
+    def eva_step(self, mode: int, minutes: int = 1) -> None:
+        """
+        Advance simulation by `minutes` of activity `mode`
+        (MODE_REST, MODE_LOW, MODE_NORMAL, MODE_HARD, MODE_COGNITIVE).
+        """
+        # Whole minutes only: the clock and the kernel must agree
+        mode = operator.index(mode)
+        minutes = operator.index(minutes)
+        if minutes <= 0:
+            raise ValueError("Time in minutes should be > 0")
+        if not 0 <= mode < len(self._TARGETS):
+            raise ValueError(f"Unknown activity mode: {mode}")
+
+        self.mission_elapsed_time += minutes
+        self._toward_target_vec(self._TARGETS[mode], self._DELTAS[mode], minutes)
+
+    # -----------------------------------------------------------------
+    # Whole mission timeline in one call
+    # -----------------------------------------------------------------
+    def advance(
+        self, schedule, out: Optional[np.ndarray] = None
+    ) -> Optional[np.ndarray]:
+        """
+        Run a sequence of (mode, minutes) segments, e.g.
+        [(MODE_HARD, 5), (MODE_REST, 2), (MODE_NORMAL, 10)],
+        as a single kernel call instead of one eva_* call per segment.
+        If `out` is given, shape (segments, fields), row k receives the
+        state after segment k; it is returned for convenience.
+        """
+        plan = np.asarray(schedule)
+        if plan.size and not np.issubdtype(plan.dtype, np.integer):
+            raise TypeError("Schedule modes and minutes must be integers")
+        if plan.size and not (plan.ndim == 2 and plan.shape[1] == 2):
+            raise ValueError("Schedule must be a sequence of (mode, minutes) pairs")
+        plan = plan.astype(np.int64).reshape(-1, 2)
+        modes = np.ascontiguousarray(plan[:, 0])
+        minutes = np.ascontiguousarray(plan[:, 1])
+
+        if (minutes <= 0).any():
+            raise ValueError("Time in minutes should be > 0")
+        if ((modes < 0) | (modes >= len(self._TARGETS))).any():
+            raise ValueError("Unknown activity mode in schedule")
+        if out is not None and out.shape != (len(modes), len(self.state)):
+            raise ValueError("History output must have shape (segments, fields)")
+
+        self.mission_elapsed_time += int(minutes.sum())
+        tables = (self._TARGETS, self._DELTAS, self._LOW_ARR, self._HIGH_ARR)
+        if out is None:
+            run_schedule(self.state, *tables, modes, minutes, self._scratch)
+        else:
+            record_schedule(self.state, *tables, modes, minutes, self._scratch, out)
+        return out
 
     # -----------------------------------------------------------------
     # Drift toward basic rest BASELINE
@@ -109,16 +361,7 @@ class Astronaut:
         Advance simulation by one minute of resting in the suit.
         Includes physiological recovery effects.
         """
-        assert minutes > 0, "Time in minutes should be > 0"
-
-        for _ in range(minutes):
-            self.mission_elapsed_time += 1
-
-            for attr, row in self._ATTR_DF.iterrows():
-                target = row["R_BASE"]
-                rate = row["R_RATE"]
-                if pd.notna(target) and pd.notna(rate):
-                    self._toward_target(attr, target, abs(rate))
+        self.eva_step(MODE_REST, minutes)
         
 
     # -----------------------------------------------------------------
@@ -129,16 +372,7 @@ class Astronaut:
         Light EVA activity — such as monitoring instruments,
         adjusting small equipment, or observing surroundings. Physically light.
         """
-        assert minutes > 0, "Time in minutes should be > 0"
-
-        for _ in range(minutes):
-            self.mission_elapsed_time += 1
-
-            for attr, row in self._ATTR_DF.iterrows():
-                target = row["L_BASE"]
-                rate = row["L_RATE"]
-                if pd.notna(target) and pd.notna(rate):
-                    self._toward_target(attr, target, abs(rate))
+        self.eva_step(MODE_LOW, minutes)
 
     # -----------------------------------------------------------------
     # NORMAL workload 
@@ -147,16 +381,7 @@ class Astronaut:
         """
         Moderate EVA activity—hand-rail translation, routine tool use.
         """
-        assert minutes > 0, "Time in minutes should be > 0"
-
-        for _ in range(minutes):
-            self.mission_elapsed_time += 1
-
-            for attr, row in self._ATTR_DF.iterrows():
-                target = row["N_BASE"]
-                rate = row["N_RATE"]
-                if pd.notna(target) and pd.notna(rate):
-                    self._toward_target(attr, target, abs(rate))
+        self.eva_step(MODE_NORMAL, minutes)
 
 
     # -----------------------------------------------------------------
@@ -166,16 +391,7 @@ class Astronaut:
         """
         High-intensity EVA exertion—hauling hardware or emergency maneuvering.
         """
-        assert minutes > 0, "Time in minutes should be > 0"
-
-        for _ in range(minutes):
-            self.mission_elapsed_time += 1
-
-            for attr, row in self._ATTR_DF.iterrows():
-                target = row["H_BASE"]
-                rate = row["H_RATE"]
-                if pd.notna(target) and pd.notna(rate):
-                    self._toward_target(attr, target, abs(rate))
+        self.eva_step(MODE_HARD, minutes)
 
 
     # -----------------------------------------------------------------
@@ -187,16 +403,22 @@ class Astronaut:
         problems or making mission-critical decisions under pressure. 
         Physical movement minimal, mental load high.
         """
-        assert minutes > 0, "Time in minutes should be > 0"
+        self.eva_step(MODE_COGNITIVE, minutes)
+
 
-        for _ in range(minutes):
-            self.mission_elapsed_time += 1
+# =============================================================
+# Named access to the state vector
+# =============================================================
+def _state_property(idx: int) -> property:
+    def fget(self) -> float:
+        return float(self.state[idx])
 
-            for attr, row in self._ATTR_DF.iterrows():
-                target = row["C_BASE"]
-                rate = row["C_RATE"]
-                if pd.notna(target) and pd.notna(rate):
-                    self._toward_target(attr, target, abs(rate))
+    def fset(self, value: float) -> None:
+        self.state[idx] = value
 
+    return property(fget, fset, doc=f"Alias for state[{idx}].")
 
 
+for _idx, _name in enumerate(_FIELDS):
+    setattr(Astronaut, _name, _state_property(_idx))
+del _idx, _name
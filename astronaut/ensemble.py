@@ -0,0 +1,142 @@
+"""
+Batched physiological model: N independent astronauts stepped together.
+"""
+
+import operator
+
+import numpy as np
+
+from . import _kernels
+from .astronaut import (
+    MODE_COGNITIVE,
+    MODE_HARD,
+    MODE_LOW,
+    MODE_NORMAL,
+    MODE_REST,
+    Astronaut,
+)
+
+
+class AstronautEnsemble:
+    """
+    Ensemble of `n` astronauts sharing the tables built by `Astronaut.init()`.
+    State is a row-major (n, len(Astronaut._FIELDS)) array, so one call
+    advances every astronaut instead of looping over Astronaut objects.
+    State defaults to float32: it halves memory traffic for large ensembles
+    and the physiological values (all below 2000, meaningful to ~0.1%) need
+    far less than double precision. Pass dtype=np.float64 to match a
+    single Astronaut bit for bit.
+    `backend="cupy"` keeps state and tables on the GPU (requires CuPy);
+    it only pays off for very large ensembles (~1e5 astronauts and up).
+    """
+
+    def __init__(self, n: int, dtype=np.float32, backend: str = "numpy"):
+        if n <= 0:
+            raise ValueError("Ensemble size should be > 0")
+
+        if backend == "numpy":
+            xp = np
+        elif backend == "cupy":
+            import cupy as xp  # optional GPU backend
+        else:
+            raise ValueError(f"Unknown backend: {backend}")
+        self._xp = xp
+
+        # Tables in the state's dtype so the kernels never mix precisions
+        self._baseline = xp.asarray(Astronaut._BASELINE_ARR.astype(dtype))
+        self._low = xp.asarray(Astronaut._LOW_ARR.astype(dtype))
+        self._high = xp.asarray(Astronaut._HIGH_ARR.astype(dtype))
+        self._targets = xp.asarray(Astronaut._TARGETS.astype(dtype))
+        self._deltas = xp.asarray(Astronaut._DELTAS.astype(dtype))
+
+        self.mission_elapsed_time = 0
+        self.state = xp.tile(self._baseline, (n, 1))
+
+        if xp is np:
+            self._tick = _kernels.tick_batch
+            self._tick_gather = _kernels.tick_gather
+            # Reused by the NumPy kernel for every step (None under Numba)
+            self._scratch = _kernels.make_scratch(self.state)
+        else:
+            self._tick = lambda *args: _kernels.xp_tick(xp, *args)
+            self._tick_gather = lambda *args: _kernels.xp_tick_gather(xp, *args)
+            self._scratch = _kernels.xp_make_scratch(xp, self.state)
+
+    def __len__(self) -> int:
+        return self.state.shape[0]
+
+    def column(self, name: str):
+        """
+        View of attribute `name` across all astronauts (e.g. "heart_rate").
+        """
+        return self.state[:, Astronaut._IDX[name]]
+
+    # =============================================================
+    # Utility: vectorized step toward per-task targets
+    # =============================================================
+    def _toward_target_vec(self, target, delta, minutes: int = 1) -> None:
+        # Same kernel as Astronaut._toward_target_vec, one row per astronaut
+        self._tick(
+            self.state, target, delta, self._low, self._high, minutes, self._scratch
+        )
+
+    # =============================================================
+    # Public methods (mirror Astronaut)
+    # =============================================================
+
+    def reset_to_rest(self) -> None:
+        """
+        Restore every astronaut to baseline resting values.
+        """
+        self.state[...] = self._baseline
+
+    def eva_step(self, mode, minutes: int = 1) -> None:
+        """
+        Advance every astronaut by `minutes` of activity `mode` (MODE_*),
+        or of per-astronaut activities given as an int array of shape (n,)
+        so a mixed ensemble (some resting, some working) is one step.
+        """
+        # Whole minutes only: the clock and the kernel must agree
+        minutes = operator.index(minutes)
+        if minutes <= 0:
+            raise ValueError("Time in minutes should be > 0")
+
+        n_modes = len(self._targets)
+        if np.ndim(mode) == 0:
+            mode = operator.index(mode)
+            if not 0 <= mode < n_modes:
+                raise ValueError(f"Unknown activity mode: {mode}")
+            self.mission_elapsed_time += minutes
+            self._toward_target_vec(self._targets[mode], self._deltas[mode], minutes)
+            return
+
+        # The compiled gather indexes the tables without bounds checks
+        modes = self._xp.asarray(mode)
+        if not np.issubdtype(modes.dtype, np.integer):
+            raise TypeError("Modes must be integers")
+        modes = modes.astype(np.intp)
+        if modes.shape != (len(self),):
+            raise ValueError("Expected one mode per astronaut")
+        if ((modes < 0) | (modes >= n_modes)).any():
+            raise ValueError("Unknown activity mode in modes")
+
+        self.mission_elapsed_time += minutes
+        self._tick_gather(
+            self.state, self._targets, self._deltas, modes,
+            self._low, self._high, minutes, self._scratch,
+        )
+
+    def eva_rest_drift(self, minutes=1) -> None:
+        self.eva_step(MODE_REST, minutes)
+
+    def eva_work_low(self, minutes=1) -> None:
+        self.eva_step(MODE_LOW, minutes)
+
+    def eva_work_normal(self, minutes=1) -> None:
+        self.eva_step(MODE_NORMAL, minutes)
+
+    def eva_work_hard(self, minutes=1) -> None:
+        self.eva_step(MODE_HARD, minutes)
+
+    def eva_task_cognitive(self, minutes=1) -> None:
+        self.eva_step(MODE_COGNITIVE, minutes)
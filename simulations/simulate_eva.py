@@ -20,17 +20,26 @@ The CSV layout:
     └────┴──────┴────────────────┴────────────────┴─────┴───────────┘
 """
 
-import pandas as pd
-from astronaut import Astronaut
+import csv
+
+import numpy as np
+from astronaut import (
+    MODE_COGNITIVE,
+    MODE_HARD,
+    MODE_LOW,
+    MODE_NORMAL,
+    MODE_REST,
+    Astronaut,
+)
 
 Astronaut.init()
 
 granularity_minutes = 10
 
-df = pd.read_csv("missions/Solar_panel_installation.csv")  
-
-# Extract 'EVA-1 Type' column and convert to single string
-sequence = ''.join(df['EVA-2 Type'].astype(str).str.strip())
+# Extract 'EVA-2 Type' column as a single string; plain csv is enough
+# for one column and keeps pandas out of the mission read
+with open("missions/Solar_panel_installation.csv", newline="") as f:
+    sequence = "".join(row["EVA-2 Type"].strip() for row in csv.DictReader(f))
 
 print("EVA tasks sequence: "+sequence)
 
@@ -41,51 +50,78 @@ print("EVA tasks sequence: "+sequence)
 #tasks = list("LNNRHHRCCCLLNHNLLRNHNLLRNHNLLRRCCCLNHNR") #390 minutes 
 #tasks = sequence
 tasks = list("LLLNNCLCLNHHRLCLLNHNRNCRNNLLNHRNCLNNNNL")
+# One letter per item whichever input is picked (`sequence` is a str)
+tasks = list(tasks)
 # -----------------------------------------------------------------
 # 2. Initialise astronaut and logging table
 # -----------------------------------------------------------------
 astro = Astronaut()
 
-# Use baseline keys + mission_elapsed_time for logging order
-param_names = ["task"] + list(astro._BASELINE.keys()) + ["mission_elapsed_time"]
-
-# DataFrame with these rows, columns added dynamically
-log_df = pd.DataFrame(index=param_names)
-
-# Helper to snapshot current astronaut state into a Series
-def snapshot(label: str, task_letter: str) -> pd.Series:
-    data = {"task": task_letter}
-    # dynamic physio values
-    for k in astro._BASELINE.keys():
-        data[k] = getattr(astro, k)
-    # mission time
-    data["mission_elapsed_time"] = astro.mission_elapsed_time
-    return pd.Series(data, name=label)
+# Use state fields + mission_elapsed_time for logging order
+param_names = list(astro._FIELDS) + ["mission_elapsed_time"]
+n_steps = len(tasks)
+
+# Preallocated log: columns B, MIN, MAX, then one column per task step.
+# Numeric rows and the task-letter row are kept apart and joined once.
+numeric = np.full((len(param_names), n_steps + 3), np.nan)
+numeric[:-1, 0] = astro._BASELINE_ARR
+numeric[:-1, 1] = astro._LOW_ARR
+numeric[:-1, 2] = astro._HIGH_ARR
+numeric[-1, 0] = astro.mission_elapsed_time
+
+task_row = np.empty(n_steps + 3, dtype=object)
+task_row[:3] = ["B", "", ""]
+
+# Task letter (as a byte) -> activity mode; -1 marks unknown letters
+mode_of_code = np.full(256, -1, dtype=np.int64)
+for letter, mode in {
+    "H": MODE_HARD,
+    "N": MODE_NORMAL,
+    "R": MODE_REST,
+    "L": MODE_LOW,
+    "C": MODE_COGNITIVE,
+}.items():
+    mode_of_code[ord(letter)] = mode
 
 # -----------------------------------------------------------------
-# Main loop
+# Run the task sequence
 # -----------------------------------------------------------------
-for minute, letter in enumerate(tasks, start=1):
-    if letter == "H":
-        astro.eva_work_hard(granularity_minutes)
-    elif letter == "N":
-        astro.eva_work_normal(granularity_minutes)
-    elif letter == "R":
-        astro.eva_rest_drift(granularity_minutes)
-    elif letter == "L":
-        astro.eva_work_low(granularity_minutes)
-    elif letter == "C":
-        astro.eva_task_cognitive(granularity_minutes)
-    else:
-        raise ValueError(f"Unknown task letter: {letter}")
-
-    column_label = str(minute * granularity_minutes)        
-    log_df[column_label] = snapshot(column_label, letter)
+task_codes = np.frombuffer("".join(tasks).encode("ascii"), dtype=np.uint8)
+task_modes = mode_of_code[task_codes]
+unknown = np.flatnonzero(task_modes < 0)
+if unknown.size:
+    raise ValueError(f"Unknown task letter: {tasks[unknown[0]]}")
+schedule = np.column_stack((task_modes, np.full(n_steps, granularity_minutes)))
+
+# The whole run is one kernel call; row k of `history` is the state
+# after task k
+start_time = astro.mission_elapsed_time
+history = astro.advance(schedule, out=np.empty((n_steps, len(astro.state))))
+
+task_row[3:] = tasks
+numeric[:-1, 3:] = history.T
+numeric[-1, 3:] = start_time + granularity_minutes * np.arange(1, n_steps + 1)
+
+column_labels = ["B", "MIN", "MAX"] + [
+    str(step * granularity_minutes) for step in range(1, n_steps + 1)
+]
 
 # -----------------------------------------------------------------
 # Write to CSV
 # -----------------------------------------------------------------
 
-log_df = log_df.applymap(lambda v: round(float(v), 4) if isinstance(v, (int, float)) else v)
-log_df.to_csv("eva_log.csv")           # no need for float_format now
+# Header and task row by hand, then the state block in one savetxt call
+# with the row label as a leading string column. mission_elapsed_time
+# has no MIN/MAX, so its blank cells are written by hand as well.
+row_fmt = ["%s"] + ["%.4f"] * len(column_labels)
+state_rows = np.empty((len(param_names) - 1, len(column_labels) + 1), dtype=object)
+state_rows[:, 0] = param_names[:-1]
+state_rows[:, 1:] = numeric[:-1]
+time_cells = ["" if np.isnan(v) else f"{v:.4f}" for v in numeric[-1]]
+
+with open("eva_log.csv", "w", newline="") as f:
+    f.write(",".join(["", *column_labels]) + "\n")
+    f.write(",".join(["task", *task_row]) + "\n")
+    np.savetxt(f, state_rows, fmt=row_fmt, delimiter=",")
+    f.write(",".join([param_names[-1], *time_cells]) + "\n")
 print("Simulation complete. Log written to eva_log.csv")
@@ -0,0 +1,12 @@
+# ------------------------------------------------------------------
+# > pytest
+# ------------------------------------------------------------------
+
+import pytest
+from astronaut import Astronaut
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _init_astronaut_tables():
+    """Load attributes.csv once for the whole test session."""
+    Astronaut.init()
@@ -2,21 +2,43 @@
 # > pytest
 # ------------------------------------------------------------------
 
+import os
+import shutil
+import sys
+
+import numpy as np
 import pytest
-from astronaut import Astronaut
+from astronaut import (
+    MODE_HARD,
+    MODE_NORMAL,
+    MODE_REST,
+    Astronaut,
+)
+from astronaut.astronaut import CORE_TEMP, HEART_RATE
 
 
 def fresh() -> Astronaut:
     """Return a baseline astronaut ready for each test."""
-    Astronaut.init() 
     return Astronaut()
 
 
+@pytest.fixture(scope="module")
+def _shared_astronaut() -> Astronaut:
+    return Astronaut()
+
+
+@pytest.fixture
+def a(_shared_astronaut) -> Astronaut:
+    """The module's astronaut, reset to baseline instead of rebuilt."""
+    _shared_astronaut.reset_to_rest()
+    _shared_astronaut.mission_elapsed_time = 0
+    return _shared_astronaut
+
+
 # ------------------------------------------------------------------
 # reset_to_rest
 # ------------------------------------------------------------------
-def test_reset_to_rest():
-    a = fresh()
+def test_reset_to_rest(a):
     a.heart_rate = 150
     a.core_temp = 38.5
     a.muscle_fatigue = 0.4
@@ -32,8 +54,7 @@ def test_reset_to_rest():
 # ------------------------------------------------------------------
 # eva_rest_drift_1min
 # ------------------------------------------------------------------
-def test_eva_rest_drift():
-    a = fresh()
+def test_eva_rest_drift(a):
     # run one minute of rest
     a.eva_rest_drift(1)
 
@@ -50,52 +71,291 @@ def test_eva_rest_drift():
 
 
 # ------------------------------------------------------------------
-# eva_work_normal_1min
+# one minute of each work mode
 # ------------------------------------------------------------------
-def test_eva_work_normal():
-    a = fresh()
-    a.eva_work_normal(1)
+@pytest.mark.parametrize(
+    "method, expected",
+    [
+        (
+            "eva_work_normal",
+            {
+                "heart_rate": 75,
+                "respiration_rate": 13.2,
+                "metabolic_rate": 82.833333333,
+                "blood_co2_pa": 39.866666667,
+                "oxygen_saturation": 97.9,
+                "core_temp": 37.005555556,
+                "skin_temp": 33.033333333,
+                "glucose_level": 89.861111111,
+                "muscle_fatigue": 0.1,
+            },
+        ),
+        (
+            "eva_work_hard",
+            {
+                "heart_rate": 79,
+                "respiration_rate": 13.8,
+                "metabolic_rate": 85.333333333,
+                "blood_co2_pa": 40.5,
+                "oxygen_saturation": 97.866666667,
+                "core_temp": 37.011111111,
+                "skin_temp": 33.05,
+                "glucose_level": 89.833333333,
+                "muscle_fatigue": 0.5,
+            },
+        ),
+        (
+            "eva_work_low",
+            {
+                "heart_rate": 72,
+                "glucose_level": 89.944444444,
+            },
+        ),
+        (
+            "eva_task_cognitive",
+            {
+                "cognitive_load": 0.7,
+                "metabolic_rate": 80.666666667,
+            },
+        ),
+    ],
+)
+def test_eva_work_one_minute(a, method, expected):
+    getattr(a, method)(1)
 
     assert a.mission_elapsed_time == 1
-    assert a.heart_rate       == 75     
-    assert a.respiration_rate == 13.2     
-    assert a.metabolic_rate   > 80     
-    assert a.blood_co2_pa     == pytest.approx(39.866666667)
-    assert a.oxygen_saturation == pytest.approx(97.9)
-    assert a.core_temp        == pytest.approx(37.005555556)
-    assert a.skin_temp        == pytest.approx(33.033333333)
-    assert a.glucose_level    == pytest.approx(89.861111111)
-    assert a.muscle_fatigue   == pytest.approx(0.1)
+    for key, value in expected.items():
+        assert getattr(a, key) == pytest.approx(value), key
 
 
-# ------------------------------------------------------------------
-# eva_work_hard_1min
-# ------------------------------------------------------------------
-def test_eva_work_hard():
+def test_state_vector_named_access(a):
+    assert a.state.shape == (len(Astronaut._FIELDS),)
+    a.heart_rate = 110
+    assert a.state[Astronaut._IDX["heart_rate"]] == 110
+    assert a.heart_rate == 110
+
+
+def test_scalar_helpers_by_index(a):
+    a._update(HEART_RATE, 500)
+    assert a.heart_rate == Astronaut._LIMITS["heart_rate"][1]
+
+    a._toward_target(CORE_TEMP, 37.5, 0.2)
+    assert a.core_temp == pytest.approx(37.2)
+    a._toward_target(CORE_TEMP, 37.5, 0.5)
+    assert a.core_temp == 37.5
+
+
+def test_validate_deltas_rejects_bad_rate():
+    Astronaut._DELTAS[MODE_HARD, 0] = float("inf")
+    try:
+        with pytest.raises(ValueError, match="H_RATE"):
+            Astronaut.validate_deltas()
+    finally:
+        Astronaut.init(force=True)
+
+
+def test_multi_minute_call_matches_single_minutes():
     a = fresh()
+    b = fresh()
+    a.eva_work_hard(25)
+    for _ in range(25):
+        b.eva_work_hard(1)
+
+    assert a.mission_elapsed_time == b.mission_elapsed_time == 25
+    assert a.state == pytest.approx(b.state)
+
+
+def test_multi_minute_call_from_outside_limits():
+    a = fresh()
+    b = fresh()
+    for x in (a, b):
+        x.heart_rate = 300
+        x.core_temp = 30.0
+    a.eva_work_hard(5)
+    for _ in range(5):
+        b.eva_work_hard(1)
+
+    assert a.heart_rate == 160
+    assert a.state == pytest.approx(b.state)
+
+
+def test_eva_step_matches_named_method():
+    a = fresh()
+    b = fresh()
+    a.eva_step(MODE_NORMAL, 5)
+    b.eva_work_normal(5)
+
+    assert a.mission_elapsed_time == b.mission_elapsed_time
+    assert list(a.state) == list(b.state)
+
+
+def test_eva_step_rejects_unknown_mode():
+    a = fresh()
+    for mode in (-1, 5, 9):
+        with pytest.raises(ValueError, match="mode"):
+            a.eva_step(mode)
+    assert a == fresh()
+
+
+def test_eq_and_repr():
+    a = fresh()
+    b = fresh()
+    assert a == b
+
     a.eva_work_hard(1)
+    assert a != b
+    b.eva_work_hard(1)
+    assert a == b
 
-    assert a.mission_elapsed_time == 1
-    assert a.heart_rate       == 79     
-    assert a.respiration_rate == 13.8      
-    assert a.metabolic_rate   == 85.333333333    
-    assert a.blood_co2_pa     == pytest.approx(40.5)
-    assert a.oxygen_saturation == pytest.approx(97.866666667)
-    assert a.core_temp        == pytest.approx(37.011111111)
-    assert a.skin_temp        == pytest.approx(33.05)
-    assert a.glucose_level    == pytest.approx(89.833333333)
-    assert a.muscle_fatigue   == pytest.approx(0.5)
-
-
-def test_eva_work_low():
-    a = Astronaut()
-    a.eva_work_low(1)
-    assert a.heart_rate == 72
-    assert a.glucose_level < Astronaut._BASELINE["glucose_level"]
-
-def test_eva_task_cognitive():
-    a = Astronaut()
-    a.eva_task_cognitive(1)
-    assert a.cognitive_load > Astronaut._BASELINE["cognitive_load"]
-    assert a.metabolic_rate > Astronaut._BASELINE["metabolic_rate"]
+    assert repr(a).startswith("Astronaut(mission_elapsed_time=1")
+    assert "heart_rate=79" in repr(a)
+
+
+def test_non_positive_minutes_rejected(a):
+    with pytest.raises(ValueError):
+        a.eva_work_normal(0)
+    assert a.mission_elapsed_time == 0
+
+
+def test_advance_matches_step_by_step():
+    schedule = [(MODE_HARD, 5), (MODE_REST, 2), (MODE_NORMAL, 10), (MODE_HARD, 3)]
+    a = fresh()
+    b = fresh()
+    a.advance(schedule)
+    for mode, minutes in schedule:
+        b.eva_step(mode, minutes)
+
+    assert a == b
+    assert a.mission_elapsed_time == 20
+
+    with pytest.raises(ValueError):
+        a.advance([(99, 1)])
+    for malformed in ([[3, 5, 1], [1, 2, 2]], [(MODE_HARD, 5, MODE_REST, 2)], [5, 1]):
+        with pytest.raises(ValueError, match="pairs"):
+            a.advance(malformed)
+    assert a.mission_elapsed_time == 20
+
+
+def test_advance_records_state_after_each_segment():
+    schedule = [(MODE_HARD, 5), (MODE_REST, 2), (MODE_NORMAL, 10)]
+    a = fresh()
+    b = fresh()
+    history = a.advance(schedule, out=np.empty((3, len(a.state))))
+    for k, (mode, minutes) in enumerate(schedule):
+        b.eva_step(mode, minutes)
+        np.testing.assert_array_equal(history[k], b.state)
+
+    with pytest.raises(ValueError):
+        a.advance(schedule, out=np.empty((2, len(a.state))))
+
+
+def test_mission_clock_is_integer_minutes(a):
+    a.eva_work_low(3)
+    a.eva_rest_drift(4)
+    assert a.mission_elapsed_time == 7
+    assert isinstance(a.mission_elapsed_time, int)
+
+
+def test_fractional_minutes_rejected(a):
+    with pytest.raises(TypeError):
+        a.eva_work_hard(2.5)
+    with pytest.raises(TypeError):
+        a.advance([(MODE_HARD, 2.5)])
+    assert a.mission_elapsed_time == 0
+    assert np.array_equal(a.state, Astronaut._BASELINE_ARR)
+
+    a.eva_work_hard(np.int64(2))
+    assert a.mission_elapsed_time == 2
+
+
+def test_attribute_tables_cached_as_npz(tmp_path, monkeypatch):
+    csv_path = tmp_path / "attributes.csv"
+    shutil.copy("attributes.csv", csv_path)
+
+    parsed = Astronaut._load_tables(str(csv_path))
+    assert (tmp_path / "attributes.npz").exists()
+
+    # A cache hit must not need pandas at all
+    monkeypatch.setitem(sys.modules, "pandas", None)
+    cached = Astronaut._load_tables(str(csv_path))
+    assert parsed.keys() == cached.keys()
+    for key in parsed:
+        np.testing.assert_array_equal(parsed[key], cached[key])
+
+    # ...while use_cache=False always re-parses
+    with pytest.raises(ImportError):
+        Astronaut._load_tables(str(csv_path), use_cache=False)
+
+
+def test_changed_csv_is_reparsed(tmp_path):
+    csv_path = tmp_path / "attributes.csv"
+    text = open("attributes.csv").read()
+    csv_path.write_text(text)
+    before = Astronaut._load_tables(str(csv_path))
+    h_base = before["H_BASE"][before["index"].tolist().index("heart_rate")]
+    assert h_base == 160
+
+    # Same size, older timestamp (as left by cp -p / rsync -a)
+    csv_path.write_text(text.replace(",160,9,", ",150,9,", 1))
+    cache_mtime = os.stat(tmp_path / "attributes.npz").st_mtime
+    os.utime(csv_path, (cache_mtime - 3600, cache_mtime - 3600))
+
+    after = Astronaut._load_tables(str(csv_path))
+    assert after["H_BASE"][after["index"].tolist().index("heart_rate")] == 150
+
+
+def test_init_is_idempotent():
+    targets = Astronaut._TARGETS
+    Astronaut.init()
+    Astronaut.init(os.path.abspath("attributes.csv"))
+    assert Astronaut._TARGETS is targets
+
+    Astronaut.init(force=True)
+    assert Astronaut._TARGETS is not targets
+    np.testing.assert_array_equal(Astronaut._TARGETS, targets)
+
+
+def test_failed_init_keeps_previous_tables(tmp_path):
+    bad_csv = tmp_path / "attributes.csv"
+    text = open("attributes.csv").read()
+    # heart_rate MIN 200 > MAX 180
+    bad_csv.write_text(text.replace("heart_rate,1,10,70,40,", "heart_rate,1,10,70,200,"))
+    low = Astronaut._LOW_ARR
+
+    with pytest.raises(ValueError, match="MIN > MAX"):
+        Astronaut.init(str(bad_csv))
+    assert Astronaut._LOW_ARR is low
+
+    Astronaut.init()
+    assert Astronaut._LIMITS["heart_rate"] == (40, 180)
+    assert Astronaut._LOW_ARR is low
+
+
+def test_cache_missing_columns_is_rebuilt(tmp_path):
+    csv_path = tmp_path / "attributes.csv"
+    shutil.copy("attributes.csv", csv_path)
+    tables = Astronaut._load_tables(str(csv_path))
+
+    # Right stamp, but written without the C_* columns
+    with np.load(tmp_path / "attributes.npz") as npz:
+        partial = {k: npz[k] for k in npz.files if not k.startswith("C_")}
+    np.savez(tmp_path / "attributes.npz", **partial)
+
+    reloaded = Astronaut._load_tables(str(csv_path))
+    np.testing.assert_array_equal(reloaded["C_RATE"], tables["C_RATE"])
+    with np.load(tmp_path / "attributes.npz") as npz:
+        assert "C_RATE" in npz.files
+
+
+def test_failed_cache_write_leaves_no_temp_file(tmp_path):
+    csv_path = tmp_path / "attributes.csv"
+    shutil.copy("attributes.csv", csv_path)
+    # A directory in the cache's place makes os.replace fail
+    (tmp_path / "attributes.npz").mkdir()
 
+    tables = Astronaut._load_tables(str(csv_path))
+    assert "heart_rate" in tables["index"].tolist()
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "attributes.csv",
+        "attributes.npz",
+    ]
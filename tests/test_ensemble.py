@@ -0,0 +1,124 @@
+# ------------------------------------------------------------------
+# > pytest
+# ------------------------------------------------------------------
+
+import sys
+
+import numpy as np
+import pytest
+from astronaut import (
+    MODE_COGNITIVE,
+    MODE_HARD,
+    MODE_REST,
+    Astronaut,
+    AstronautEnsemble,
+)
+
+
+def fresh(n: int = 4) -> AstronautEnsemble:
+    """Return a float64 baseline ensemble, comparable to Astronaut exactly."""
+    return AstronautEnsemble(n, dtype=np.float64)
+
+
+def test_ensemble_starts_at_baseline():
+    e = fresh()
+    assert len(e) == 4
+    for row in e.state:
+        assert np.array_equal(row, Astronaut._BASELINE_ARR)
+
+
+@pytest.mark.parametrize("method", [
+    "eva_rest_drift", "eva_work_low", "eva_work_normal",
+    "eva_work_hard", "eva_task_cognitive",
+])
+def test_ensemble_matches_single_astronaut(method):
+    e = fresh()
+    a = Astronaut()
+    getattr(e, method)(7)
+    getattr(a, method)(7)
+
+    assert e.mission_elapsed_time == a.mission_elapsed_time
+    for row in e.state:
+        assert np.array_equal(row, a.state)
+
+
+def test_ensemble_column_and_reset():
+    e = fresh()
+    e.eva_work_hard(3)
+    assert np.all(e.column("heart_rate") > Astronaut._BASELINE["heart_rate"])
+
+    e.reset_to_rest()
+    assert np.all(e.column("heart_rate") == Astronaut._BASELINE["heart_rate"])
+
+
+def test_float32_ensemble_tracks_float64():
+    e32 = AstronautEnsemble(3)
+    e64 = AstronautEnsemble(3, dtype=np.float64)
+    for e in (e32, e64):
+        e.eva_work_hard(12)
+        e.eva_rest_drift(5)
+        e.eva_task_cognitive(9)
+
+    assert e32.state.dtype == np.float32
+    assert e32.state == pytest.approx(e64.state, rel=1e-5)
+
+
+def test_mixed_modes_match_single_astronauts():
+    e = fresh(3)
+    e.eva_work_normal(4)
+    modes = np.array([MODE_HARD, MODE_REST, MODE_COGNITIVE])
+    e.eva_step(modes, 6)
+
+    for row, mode in zip(e.state, modes):
+        a = Astronaut()
+        a.eva_work_normal(4)
+        a.eva_step(mode, 6)
+        assert np.array_equal(row, a.state)
+    assert e.mission_elapsed_time == 10
+
+
+def test_bad_modes_rejected():
+    e = fresh(4)
+    for modes in ([40, 0, 0, 0], [-1, 0, 0, 0], [0, 0], [[0, 0], [0, 0]]):
+        with pytest.raises(ValueError, match="mode"):
+            e.eva_step(np.array(modes))
+    with pytest.raises(ValueError, match="mode"):
+        e.eva_step(-1)
+
+    assert e.mission_elapsed_time == 0
+    for row in e.state:
+        assert np.array_equal(row, Astronaut._BASELINE_ARR)
+
+
+def test_cupy_backend_matches_numpy(monkeypatch):
+    # NumPy stands in for CuPy: exercises the array-module (xp_*) kernels
+    monkeypatch.setitem(sys.modules, "cupy", np)
+    e_xp = AstronautEnsemble(3, dtype=np.float64, backend="cupy")
+    e_np = fresh(3)
+    modes = np.array([MODE_HARD, MODE_REST, MODE_COGNITIVE])
+    for e in (e_xp, e_np):
+        e.eva_work_normal(4)
+        e.eva_step(modes, 6)
+        e.eva_rest_drift(1)
+
+    assert e_xp.mission_elapsed_time == e_np.mission_elapsed_time == 11
+    assert e_xp.state == pytest.approx(e_np.state)
+
+
+def test_fractional_minutes_and_modes_rejected():
+    e = fresh(2)
+    with pytest.raises(TypeError):
+        e.eva_work_hard(2.5)
+    with pytest.raises(TypeError):
+        e.eva_step(np.array([0.5, 1.0]))
+    assert e.mission_elapsed_time == 0
+
+
+def test_empty_ensemble_rejected():
+    with pytest.raises(ValueError, match="size"):
+        AstronautEnsemble(0)
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError, match="backend"):
+        AstronautEnsemble(2, backend="fortran")